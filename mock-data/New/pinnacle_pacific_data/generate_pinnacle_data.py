@@ -5,10 +5,12 @@ Dual business: Airport construction ($480M) + 500-unit luxury condo ($185M + pro
 
 Output: Pinnacle_Pacific_Builders_Import.xlsx
 
-Usage: python generate_pinnacle_data.py
-Requires: pip install openpyxl
+Usage: python generate_pinnacle_data.py [--csv]
+Requires: pip install xlsxwriter (or openpyxl)
 """
 
+import argparse
+import csv
 import sys
 import os
 from collections import defaultdict
@@ -29,6 +31,89 @@ from part08_property_mgmt import generate_leases, generate_maintenance, generate
 from part09_assignments_estimates import generate_equipment_assignments, generate_estimates
 
 
+# Sheet order matches DEPENDENCY_ORDER in xlsx-parser.ts
+# Sheet names must match SHEET_ENTITY_MAP (case-insensitive, spaces)
+SHEET_CONFIG = [
+    ("chart_of_accounts", "Chart of Accounts"),
+    ("bank_accounts", "Bank Accounts"),
+    ("properties", "Properties"),
+    ("units", "Units"),
+    ("projects", "Projects"),
+    ("contacts", "Contacts"),
+    ("vendors", "Vendors"),
+    ("equipment", "Equipment"),
+    ("phases", "Phases"),
+    ("contracts", "Contracts"),
+    ("opportunities", "Opportunities"),
+    ("bids", "Bids"),
+    ("leases", "Leases"),
+    ("maintenance", "Maintenance"),
+    ("invoices", "Invoices"),
+    ("journal_entries", "Journal Entries"),
+    ("time_entries", "Time Entries"),
+    ("change_orders", "Change Orders"),
+    ("daily_logs", "Daily Logs"),
+    ("rfis", "RFIs"),
+    ("safety_incidents", "Safety Incidents"),
+    ("safety_inspections", "Safety Inspections"),
+    ("toolbox_talks", "Toolbox Talks"),
+    ("equipment_assignments", "Equipment Assignments"),
+    ("equipment_maintenance", "Equipment Maintenance"),
+    ("submittals", "Submittals"),
+    ("tasks", "Tasks"),
+    ("property_expenses", "Property Expenses"),
+    ("estimates", "Estimates"),
+    ("certifications", "Certifications"),
+]
+
+
+def _apply_invoice_jes(invoices, gl_balances):
+    """Add the auto-JEs the import system books for each invoice to gl_balances.
+
+    Receivable: DR AR / CR gl_account (revenue or retained earnings)
+                If paid: DR Cash / CR AR
+                If retainage: DR Retainage Recv / CR AR (reduce AR by retainage)
+    Payable:   DR gl_account (expense or retained earnings) / CR AP
+               If paid: DR AP / CR Cash
+               If retainage: DR AP / CR Retainage Pay
+
+    The cash, AR/AP and retainage legs hit the same five accounts for every
+    invoice, so they are summed in locals and posted once at the end.
+    """
+    cash = ar = ret_recv = ap = ret_pay = 0.0
+    for inv in invoices:
+        amt = inv.amount
+        ret = inv.retainage_held
+        gl = inv.gl_account
+        is_paid = inv.status == "paid"
+
+        if inv.invoice_type == "receivable":
+            net_ar = amt - ret
+            ar += net_ar                     # DR AR (net of retainage)
+            ret_recv += ret                  # DR Retainage Receivable
+            if gl:
+                gl_balances[gl] -= amt       # CR Revenue/RE
+            if is_paid:
+                cash += net_ar               # DR Cash
+                ar -= net_ar                 # CR AR
+
+        elif inv.invoice_type == "payable":
+            net_ap = amt - ret
+            if gl:
+                gl_balances[gl] += amt       # DR Expense/RE
+            ap -= net_ap                     # CR AP (net of retainage)
+            ret_pay -= ret                   # CR Retainage Payable
+            if is_paid:
+                ap += net_ap                 # DR AP
+                cash -= net_ap               # CR Cash
+
+    gl_balances[1000] += cash
+    gl_balances[1010] += ar
+    gl_balances[1020] += ret_recv
+    gl_balances[2000] += ap
+    gl_balances[2010] += ret_pay
+
+
 def verify_financials(je_rows, invoices):
     """Verify financial integrity of the generated data."""
     print("\n" + "="*70)
@@ -36,67 +121,32 @@ def verify_financials(je_rows, invoices):
     print("="*70)
 
     # 1. Verify all JEs balance individually
-    je_totals = defaultdict(lambda: [0.0, 0.0])
+    # 2. Build trial balance from JEs only (non-AR/AP)
+    # Both are accumulated in a single pass, parsing each line's amounts once
+    je_debits = defaultdict(float)
+    je_credits = defaultdict(float)
+    gl_balances = defaultdict(float)
     for r in je_rows:
-        dr = float(r["debit"]) if r["debit"] else 0
-        cr = float(r["credit"]) if r["credit"] else 0
-        je_totals[r["entry_number"]][0] += dr
-        je_totals[r["entry_number"]][1] += cr
+        dr = float(r.debit) if r.debit else 0
+        cr = float(r.credit) if r.credit else 0
+        je_debits[r.entry_number] += dr
+        je_credits[r.entry_number] += cr
+        gl_balances[r.account_number] += dr - cr  # Debit-normal
 
     unbalanced = 0
-    for je, (dr, cr) in je_totals.items():
+    for je, dr in je_debits.items():
+        cr = je_credits[je]
         if abs(dr - cr) > 0.02:
             print(f"  UNBALANCED JE: {je} DR={dr:.2f} CR={cr:.2f}")
             unbalanced += 1
 
     if unbalanced == 0:
-        print(f"[OK] All {len(je_totals)} journal entries balance")
+        print(f"[OK] All {len(je_debits)} journal entries balance")
     else:
         print(f"[FAIL] {unbalanced} unbalanced journal entries!")
 
-    # 2. Build trial balance from JEs only (non-AR/AP)
-    gl_balances = defaultdict(float)
-    for r in je_rows:
-        acct = int(r["account_number"])
-        dr = float(r["debit"]) if r["debit"] else 0
-        cr = float(r["credit"]) if r["credit"] else 0
-        gl_balances[acct] += dr - cr  # Debit-normal
-
     # 3. Estimate invoice auto-JE impact
-    # Receivable: DR AR / CR gl_account (revenue or retained earnings)
-    #             If paid: DR Cash / CR AR
-    #             If retainage: DR Retainage Recv / CR AR (reduce AR by retainage)
-    # Payable:   DR gl_account (expense or retained earnings) / CR AP
-    #            If paid: DR AP / CR Cash
-    #            If retainage: DR AP / CR Retainage Pay
-
-    for inv in invoices:
-        amt = float(inv["amount"])
-        ret = float(inv["retainage_held"]) if inv.get("retainage_held") else 0
-        gl = int(inv["gl_account"]) if inv.get("gl_account") else None
-        is_paid = inv["status"] == "paid"
-
-        if inv["invoice_type"] == "receivable":
-            net_ar = amt - ret
-            gl_balances[1010] += net_ar      # DR AR (net of retainage)
-            if ret > 0:
-                gl_balances[1020] += ret     # DR Retainage Receivable
-            if gl:
-                gl_balances[gl] -= amt       # CR Revenue/RE
-            if is_paid:
-                gl_balances[1000] += net_ar  # DR Cash
-                gl_balances[1010] -= net_ar  # CR AR
-
-        elif inv["invoice_type"] == "payable":
-            net_ap = amt - ret
-            if gl:
-                gl_balances[gl] += amt       # DR Expense/RE
-            gl_balances[2000] -= net_ap      # CR AP (net of retainage)
-            if ret > 0:
-                gl_balances[2010] -= ret     # CR Retainage Payable
-            if is_paid:
-                gl_balances[2000] += net_ap  # DR AP
-                gl_balances[1000] -= net_ap  # CR Cash
+    _apply_invoice_jes(invoices, gl_balances)
 
     # 4. Print trial balance
     print(f"\n{'TRIAL BALANCE (Estimated Post-Import)':^70}")
@@ -106,34 +156,10 @@ def verify_financials(je_rows, invoices):
 
     total_dr = 0
     total_cr = 0
-    for acct in sorted(gl_balances.keys()):
-        bal = gl_balances[acct]
+    for acct, bal in sorted(gl_balances.items()):
         if abs(bal) < 0.01:
             continue
-        # Get account name
-        name = str(acct)
-        for row_acct, (row_name, _) in list(DIRECT_COST_ACCOUNTS.items()) + list(PROPERTY_MGMT_ACCOUNTS.items()) + list(OVERHEAD_ACCOUNTS.items()):
-            if row_acct == acct:
-                name = row_name
-                break
-        acct_names = {
-            1000: "Cash & Equivalents", 1010: "Accounts Receivable", 1020: "Retainage Receivable",
-            1030: "Costs in Excess", 1040: "Prepaid Expenses", 1050: "Rent Receivable",
-            1100: "Equipment & Vehicles", 1110: "Accum Dep - Equipment",
-            1120: "Buildings & Improvements", 1130: "Accum Dep - Buildings",
-            1200: "Land", 1300: "Security Deposits",
-            2000: "Accounts Payable", 2010: "Retainage Payable", 2020: "Accrued Payroll",
-            2030: "Accrued Expenses", 2040: "Billings in Excess", 2050: "Sales Tax Payable",
-            2060: "Deferred Rental Revenue", 2100: "Equipment Financing",
-            2200: "Construction LOC", 2210: "Mortgage Payable",
-            3000: "Owners Capital", 3010: "Retained Earnings",
-            4000: "Contract Revenue - Airport", 4010: "Contract Revenue - Condo",
-            4100: "Rental Income", 4200: "Change Order Revenue",
-            6100: "Depreciation - Equipment", 6110: "Depreciation - Buildings",
-            7000: "Interest Expense",
-        }
-        if acct in acct_names:
-            name = acct_names[acct]
+        name = ACCOUNT_NAMES.get(acct, str(acct))
 
         if bal > 0:
             print(f"  {acct:>4}  {name:<42}  {bal:>12,.2f}  {'':>12}")
@@ -176,80 +202,110 @@ def verify_financials(je_rows, invoices):
         print(f"  [WARN] Net income differs from target by ${ni_diff:,.2f}")
 
 
+def _sheet_rows(data):
+    """Yield the header row followed by each data row as cell strings.
+
+    Rows are either dicts or NamedTuple records. A record's fields are declared
+    in the sheet's column order, so its field names are the header row. Missing
+    values (None) become empty cells; numeric values such as 0 are written as
+    their text form.
+    """
+    first = data[0]
+    if isinstance(first, tuple):
+        # NamedTuple records: the fields are the headers and each record is
+        # already its row of values
+        headers = first._fields
+        rows = data
+    else:
+        headers = tuple(first.keys())
+        # Headers come from the first row; a key missing from a later row is
+        # written as an empty cell
+        rows = ([row.get(h, "") for h in headers] for row in data)
+    yield headers
+    for values in rows:
+        # Most values are already strings; only convert the typed ones
+        yield [val if isinstance(val, str) else ("" if val is None else str(val))
+               for val in values]
+
+
 def build_xlsx(all_sheets):
-    """Build XLSX with proper sheet names for the Buildwrk import system."""
+    """Build XLSX with proper sheet names for the Buildwrk import system.
+
+    Uses xlsxwriter in constant_memory mode when available (rows are flushed
+    to disk as they are written), falling back to openpyxl write-only mode.
+    """
     try:
-        import openpyxl
+        import xlsxwriter
     except ImportError:
-        print("ERROR: openpyxl not installed. Run: pip install openpyxl")
-        sys.exit(1)
-
-    wb = openpyxl.Workbook()
-    wb.remove(wb.active)
-
-    # Sheet order matches DEPENDENCY_ORDER in xlsx-parser.ts
-    # Sheet names must match SHEET_ENTITY_MAP (case-insensitive, spaces)
-    SHEET_CONFIG = [
-        ("chart_of_accounts", "Chart of Accounts"),
-        ("bank_accounts", "Bank Accounts"),
-        ("properties", "Properties"),
-        ("units", "Units"),
-        ("projects", "Projects"),
-        ("contacts", "Contacts"),
-        ("vendors", "Vendors"),
-        ("equipment", "Equipment"),
-        ("phases", "Phases"),
-        ("contracts", "Contracts"),
-        ("opportunities", "Opportunities"),
-        ("bids", "Bids"),
-        ("leases", "Leases"),
-        ("maintenance", "Maintenance"),
-        ("invoices", "Invoices"),
-        ("journal_entries", "Journal Entries"),
-        ("time_entries", "Time Entries"),
-        ("change_orders", "Change Orders"),
-        ("daily_logs", "Daily Logs"),
-        ("rfis", "RFIs"),
-        ("safety_incidents", "Safety Incidents"),
-        ("safety_inspections", "Safety Inspections"),
-        ("toolbox_talks", "Toolbox Talks"),
-        ("equipment_assignments", "Equipment Assignments"),
-        ("equipment_maintenance", "Equipment Maintenance"),
-        ("submittals", "Submittals"),
-        ("tasks", "Tasks"),
-        ("property_expenses", "Property Expenses"),
-        ("estimates", "Estimates"),
-        ("certifications", "Certifications"),
-    ]
+        xlsxwriter = None
+        try:
+            import openpyxl
+        except ImportError:
+            print("ERROR: Neither xlsxwriter nor openpyxl is installed. Run: pip install xlsxwriter")
+            sys.exit(1)
+
+    out_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "Pinnacle_Pacific_Builders_Import.xlsx")
+
+    if xlsxwriter:
+        # Keep every value a text cell - the importer reads cells as strings
+        wb = xlsxwriter.Workbook(out_path, {
+            "constant_memory": True,
+            "strings_to_numbers": False,
+            "strings_to_formulas": False,
+            "strings_to_urls": False,
+        })
+    else:
+        # Write-only mode streams each row to the sheet XML instead of keeping
+        # a Cell object per value in memory
+        wb = openpyxl.Workbook(write_only=True)
 
     total_rows = 0
     for key, sheet_name in SHEET_CONFIG:
         if key not in all_sheets or not all_sheets[key]:
             continue
         data = all_sheets[key]
-        ws = wb.create_sheet(title=sheet_name)
 
-        headers = list(data[0].keys())
-        for c, h in enumerate(headers, 1):
-            ws.cell(row=1, column=c, value=h)
-
-        for r_idx, row in enumerate(data, 2):
-            for c_idx, h in enumerate(headers, 1):
-                val = row.get(h, "")
-                ws.cell(row=r_idx, column=c_idx, value=str(val) if val else "")
+        if xlsxwriter:
+            ws = wb.add_worksheet(sheet_name)
+            for r_idx, values in enumerate(_sheet_rows(data)):
+                ws.write_row(r_idx, 0, values)
+        else:
+            ws = wb.create_sheet(title=sheet_name)
+            for values in _sheet_rows(data):
+                ws.append(values)
 
         total_rows += len(data)
         print(f"  {sheet_name:<30} {len(data):>6} rows")
 
-    out_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                            "Pinnacle_Pacific_Builders_Import.xlsx")
-    wb.save(out_path)
+    if xlsxwriter:
+        wb.close()
+    else:
+        wb.save(out_path)
     print(f"\nTotal rows: {total_rows}")
     print(f"Saved to: {out_path}")
     return out_path
 
 
+def build_csvs(all_sheets, out_dir):
+    """Write one CSV per sheet (named by sheet key) with the same cell text as the XLSX."""
+    os.makedirs(out_dir, exist_ok=True)
+    for key, sheet_name in SHEET_CONFIG:
+        if key not in all_sheets or not all_sheets[key]:
+            continue
+        path = os.path.join(out_dir, f"{key}.csv")
+        # 1 MB buffer so the narrow rows reach disk in a few large writes
+        with open(path, "w", buffering=1 << 20, newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(_sheet_rows(all_sheets[key]))
+    print(f"CSVs saved to: {out_dir}")
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Generate Pinnacle Pacific Builders mock import data.")
+    parser.add_argument("--csv", action="store_true",
+                        help="also write one CSV per sheet to a csv/ folder next to this script")
+    args = parser.parse_args()
+
     print("="*70)
     print("PINNACLE PACIFIC BUILDERS - MOCK DATA GENERATOR")
     print("="*70)
@@ -313,6 +369,8 @@ def main():
     print(f"\n{'BUILDING XLSX':^70}")
     print("-"*70)
     out_path = build_xlsx(all_sheets)
+    if args.csv:
+        build_csvs(all_sheets, os.path.join(os.path.dirname(os.path.abspath(__file__)), "csv"))
 
     print(f"\n{'='*70}")
     print("DONE! Import the file via Buildwrk Settings > Import Data")
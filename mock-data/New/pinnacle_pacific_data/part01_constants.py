@@ -5,7 +5,12 @@ import random
 import string
 from datetime import date, timedelta
 from collections import defaultdict
+from functools import reduce
+import operator
 
+# Every part draws from this one seeded stream, and the workbook depends on the
+# order of the draws. Hot loops may bind random.choice etc. to locals for speed,
+# but must keep making the same calls in the same order.
 random.seed(42)
 
 # ── Company ──
@@ -133,6 +138,34 @@ OVERHEAD_ACCOUNTS = {
 }
 TOTAL_OVERHEAD = sum(v[1] for v in OVERHEAD_ACCOUNTS.values())  # 18,200,000
 
+# Account items as tuples (ascending account order), built once so callers
+# iterate them directly instead of constructing dict views in their loops
+DIRECT_COST_ITEMS = tuple(sorted(DIRECT_COST_ACCOUNTS.items()))
+PROP_MGMT_ITEMS = tuple(sorted(PROPERTY_MGMT_ACCOUNTS.items()))
+OVERHEAD_ITEMS = tuple(sorted(OVERHEAD_ACCOUNTS.items()))
+
+# Short names for the balance sheet, revenue and other accounts outside the cost model
+BS_ACCOUNT_NAMES = {
+    1000: "Cash & Equivalents", 1010: "Accounts Receivable", 1020: "Retainage Receivable",
+    1030: "Costs in Excess", 1040: "Prepaid Expenses", 1050: "Rent Receivable",
+    1100: "Equipment & Vehicles", 1110: "Accum Dep - Equipment",
+    1120: "Buildings & Improvements", 1130: "Accum Dep - Buildings",
+    1200: "Land", 1300: "Security Deposits",
+    2000: "Accounts Payable", 2010: "Retainage Payable", 2020: "Accrued Payroll",
+    2030: "Accrued Expenses", 2040: "Billings in Excess", 2050: "Sales Tax Payable",
+    2060: "Deferred Rental Revenue", 2100: "Equipment Financing",
+    2200: "Construction LOC", 2210: "Mortgage Payable",
+    3000: "Owners Capital", 3010: "Retained Earnings",
+    4000: "Contract Revenue - Airport", 4010: "Contract Revenue - Condo",
+    4100: "Rental Income", 4200: "Change Order Revenue",
+    6100: "Depreciation - Equipment", 6110: "Depreciation - Buildings",
+    7000: "Interest Expense",
+}
+
+# Flat name lookup covering every account
+ACCOUNT_NAMES = {a: n for a, (n, _) in DIRECT_COST_ITEMS + PROP_MGMT_ITEMS + OVERHEAD_ITEMS}
+ACCOUNT_NAMES.update(BS_ACCOUNT_NAMES)
+
 DEPRECIATION = 2400000
 INTEREST_EXPENSE = 4800000
 NET_INCOME = TOTAL_REVENUE - TOTAL_DIRECT - TOTAL_PROP_MGMT - TOTAL_OVERHEAD - DEPRECIATION - INTEREST_EXPENSE
@@ -177,15 +210,11 @@ def fmt(amount):
 def allocate_to_months(annual, weights):
     """Distribute annual total across 12 months proportionally."""
     total_w = sum(weights)
-    result = []
-    running = 0.0
-    for i in range(12):
-        if i < 11:
-            val = round(annual * weights[i] / total_w, 2)
-            result.append(val)
-            running += val
-        else:
-            result.append(round(annual - running, 2))
+    result = [round(annual * w / total_w, 2) for w in weights[:11]]
+    # Plain left-to-right float addition (not sum(), which is compensated on
+    # 3.12+) so the December plug comes out the same on every Python version
+    running = reduce(operator.add, result, 0.0)
+    result.append(round(annual - running, 2))
     return result
 
 
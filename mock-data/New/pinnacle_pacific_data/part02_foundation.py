@@ -1,80 +1,93 @@
 #!/usr/bin/env python3
 """Part 2: Foundation sheets - COA, bank accounts, properties, units."""
 
-from part01_constants import *
+from collections import Counter
+from itertools import product
+from typing import NamedTuple
 
+from part01_constants import *
 
-def generate_chart_of_accounts():
-    rows = []
-    def add(num, name, atype, sub, desc=""):
-        rows.append({
-            "account_number": str(num),
-            "name": name,
-            "account_type": atype,
-            "sub_type": sub,
-            "description": desc,
-        })
 
+# Static chart of accounts rows: (number, name, type, sub_type, description).
+# The cost model expense accounts from part01 go between the head and tail.
+_COA_HEAD = (
     # Assets
-    add(1000, "Cash & Equivalents", "asset", "Current Asset", "Operating cash and short-term deposits")
-    add(1010, "Accounts Receivable", "asset", "Current Asset", "Amounts owed by clients for completed work")
-    add(1020, "Retainage Receivable", "asset", "Current Asset", "Retainage withheld by owners on progress billings")
-    add(1030, "Costs in Excess of Billings", "asset", "Current Asset", "Under-billed construction costs")
-    add(1040, "Prepaid Expenses", "asset", "Current Asset", "Insurance premiums and prepaid items")
-    add(1050, "Rent Receivable", "asset", "Current Asset", "Tenant rent amounts due")
-    add(1100, "Equipment & Vehicles", "asset", "Fixed Asset", "Construction equipment and company vehicles")
-    add(1110, "Accumulated Depreciation - Equipment", "asset", "Fixed Asset", "Contra asset for equipment depreciation")
-    add(1120, "Buildings & Improvements", "asset", "Fixed Asset", "Owned buildings and tenant improvements")
-    add(1130, "Accumulated Depreciation - Buildings", "asset", "Fixed Asset", "Contra asset for building depreciation")
-    add(1200, "Land", "asset", "Fixed Asset", "Land held for development or operations")
-    add(1300, "Security Deposits - Held", "asset", "Other Asset", "Tenant security deposits held in escrow")
+    (1000, "Cash & Equivalents", "asset", "Current Asset", "Operating cash and short-term deposits"),
+    (1010, "Accounts Receivable", "asset", "Current Asset", "Amounts owed by clients for completed work"),
+    (1020, "Retainage Receivable", "asset", "Current Asset", "Retainage withheld by owners on progress billings"),
+    (1030, "Costs in Excess of Billings", "asset", "Current Asset", "Under-billed construction costs"),
+    (1040, "Prepaid Expenses", "asset", "Current Asset", "Insurance premiums and prepaid items"),
+    (1050, "Rent Receivable", "asset", "Current Asset", "Tenant rent amounts due"),
+    (1100, "Equipment & Vehicles", "asset", "Fixed Asset", "Construction equipment and company vehicles"),
+    (1110, "Accumulated Depreciation - Equipment", "asset", "Fixed Asset", "Contra asset for equipment depreciation"),
+    (1120, "Buildings & Improvements", "asset", "Fixed Asset", "Owned buildings and tenant improvements"),
+    (1130, "Accumulated Depreciation - Buildings", "asset", "Fixed Asset", "Contra asset for building depreciation"),
+    (1200, "Land", "asset", "Fixed Asset", "Land held for development or operations"),
+    (1300, "Security Deposits - Held", "asset", "Other Asset", "Tenant security deposits held in escrow"),
 
     # Liabilities
-    add(2000, "Accounts Payable", "liability", "Current Liability", "Amounts owed to subcontractors and vendors")
-    add(2010, "Retainage Payable", "liability", "Current Liability", "Retainage withheld from subcontractors")
-    add(2020, "Accrued Payroll", "liability", "Current Liability", "Wages and salaries earned but not yet paid")
-    add(2030, "Accrued Expenses", "liability", "Current Liability", "Other accrued liabilities")
-    add(2040, "Billings in Excess of Costs", "liability", "Current Liability", "Over-billed construction revenue")
-    add(2050, "Sales Tax Payable", "liability", "Current Liability", "Sales and use tax collected pending remittance")
-    add(2055, "Sales Tax Receivable", "asset", "Current Asset", "Input tax credits recoverable from vendors")
-    add(2060, "Deferred Rental Revenue", "liability", "Current Liability", "Prepaid rent from tenants")
-    add(2070, "Tenant Security Deposits Liability", "liability", "Current Liability", "Security deposits owed back to tenants")
-    add(2100, "Equipment Financing", "liability", "Long-Term Liability", "Loans on equipment purchases")
-    add(2200, "Construction Line of Credit", "liability", "Long-Term Liability", "Revolving credit facility for construction")
-    add(2210, "Mortgage Payable", "liability", "Long-Term Liability", "Mortgage on Pinnacle Bay property")
+    (2000, "Accounts Payable", "liability", "Current Liability", "Amounts owed to subcontractors and vendors"),
+    (2010, "Retainage Payable", "liability", "Current Liability", "Retainage withheld from subcontractors"),
+    (2020, "Accrued Payroll", "liability", "Current Liability", "Wages and salaries earned but not yet paid"),
+    (2030, "Accrued Expenses", "liability", "Current Liability", "Other accrued liabilities"),
+    (2040, "Billings in Excess of Costs", "liability", "Current Liability", "Over-billed construction revenue"),
+    (2050, "Sales Tax Payable", "liability", "Current Liability", "Sales and use tax collected pending remittance"),
+    (2055, "Sales Tax Receivable", "asset", "Current Asset", "Input tax credits recoverable from vendors"),
+    (2060, "Deferred Rental Revenue", "liability", "Current Liability", "Prepaid rent from tenants"),
+    (2070, "Tenant Security Deposits Liability", "liability", "Current Liability", "Security deposits owed back to tenants"),
+    (2100, "Equipment Financing", "liability", "Long-Term Liability", "Loans on equipment purchases"),
+    (2200, "Construction Line of Credit", "liability", "Long-Term Liability", "Revolving credit facility for construction"),
+    (2210, "Mortgage Payable", "liability", "Long-Term Liability", "Mortgage on Pinnacle Bay property"),
 
     # Equity
-    add(3000, "Owners Capital", "equity", "Equity", "Partner capital contributions")
-    add(3010, "Retained Earnings", "equity", "Equity", "Accumulated net income from prior years")
+    (3000, "Owners Capital", "equity", "Equity", "Partner capital contributions"),
+    (3010, "Retained Earnings", "equity", "Equity", "Accumulated net income from prior years"),
 
     # Revenue
-    add(4000, "Contract Revenue - Airport", "revenue", "Operating Revenue", "Revenue from DFW Terminal 6 construction")
-    add(4010, "Contract Revenue - Condo Construction", "revenue", "Operating Revenue", "Revenue from Pinnacle Bay construction")
-    add(4100, "Rental Income", "revenue", "Operating Revenue", "Monthly rental income from leased units")
-    add(4110, "Late Fee Revenue", "revenue", "Other Revenue", "Late payment fees charged to tenants")
-    add(4200, "Change Order Revenue", "revenue", "Operating Revenue", "Approved change order billings")
+    (4000, "Contract Revenue - Airport", "revenue", "Operating Revenue", "Revenue from DFW Terminal 6 construction"),
+    (4010, "Contract Revenue - Condo Construction", "revenue", "Operating Revenue", "Revenue from Pinnacle Bay construction"),
+    (4100, "Rental Income", "revenue", "Operating Revenue", "Monthly rental income from leased units"),
+    (4110, "Late Fee Revenue", "revenue", "Other Revenue", "Late payment fees charged to tenants"),
+    (4200, "Change Order Revenue", "revenue", "Operating Revenue", "Approved change order billings"),
+)
+
+_COA_TAIL = (
+    # Depreciation
+    (6100, "Depreciation Expense - Equipment", "expense", "Operating Expense", "Monthly depreciation of equipment and vehicles"),
+    (6110, "Depreciation Expense - Buildings", "expense", "Operating Expense", "Monthly depreciation of buildings"),
+
+    # Other Expense
+    (7000, "Interest Expense", "expense", "Other Expense", "Interest on debt and credit facilities"),
+    (7010, "Financing Costs", "expense", "Other Expense", "Loan origination fees and financing charges"),
+)
+
+
+def generate_chart_of_accounts():
+    accounts = list(_COA_HEAD)
 
     # Direct Costs
-    for acct, (name, _) in sorted(DIRECT_COST_ACCOUNTS.items()):
-        add(acct, name, "expense", "Direct Cost", f"Direct construction cost - {name}")
+    accounts += [(acct, name, "expense", "Direct Cost", f"Direct construction cost - {name}")
+                 for acct, (name, _) in DIRECT_COST_ITEMS]
 
     # Property Management Expenses
-    for acct, (name, _) in sorted(PROPERTY_MGMT_ACCOUNTS.items()):
-        add(acct, name, "expense", "Operating Expense", f"Property management - {name}")
+    accounts += [(acct, name, "expense", "Operating Expense", f"Property management - {name}")
+                 for acct, (name, _) in PROP_MGMT_ITEMS]
 
     # Overhead / G&A
-    for acct, (name, _) in sorted(OVERHEAD_ACCOUNTS.items()):
-        add(acct, name, "expense", "Operating Expense", f"General & administrative - {name}")
-
-    # Depreciation
-    add(6100, "Depreciation Expense - Equipment", "expense", "Operating Expense", "Monthly depreciation of equipment and vehicles")
-    add(6110, "Depreciation Expense - Buildings", "expense", "Operating Expense", "Monthly depreciation of buildings")
+    accounts += [(acct, name, "expense", "Operating Expense", f"General & administrative - {name}")
+                 for acct, (name, _) in OVERHEAD_ITEMS]
 
-    # Other Expense
-    add(7000, "Interest Expense", "expense", "Other Expense", "Interest on debt and credit facilities")
-    add(7010, "Financing Costs", "expense", "Other Expense", "Loan origination fees and financing charges")
-
-    return rows
+    accounts += _COA_TAIL
+    return [
+        {
+            "account_number": str(num),
+            "name": name,
+            "account_type": atype,
+            "sub_type": sub,
+            "description": desc,
+        }
+        for num, name, atype, sub, desc in accounts
+    ]
 
 
 def generate_bank_accounts():
@@ -102,18 +115,38 @@ def generate_properties():
         "city": PROPERTY["city"],
         "state": PROPERTY["state"],
         "zip": PROPERTY["zip"],
-        "year_built": str(PROPERTY["year_built"]),
-        "total_sqft": str(PROPERTY["total_sqft"]),
-        "total_units": str(PROPERTY["total_units"]),
-        "purchase_price": str(PROPERTY["purchase_price"]),
-        "current_value": str(PROPERTY["current_value"]),
+        "year_built": PROPERTY["year_built"],
+        "total_sqft": PROPERTY["total_sqft"],
+        "total_units": PROPERTY["total_units"],
+        "purchase_price": PROPERTY["purchase_price"],
+        "current_value": PROPERTY["current_value"],
     }]
 
 
+class Unit(NamedTuple):
+    property_name: str
+    unit_number: str
+    unit_type: str
+    sqft: int
+    bedrooms: int
+    bathrooms: int
+    floor_number: int
+    market_rent: int
+    status: str
+
+
+# Zero-padded "00".."99" for building unit numbers (floor + index on floor)
+_TWO_DIGIT = [f"{i:02d}" for i in range(100)]
+
+
 def generate_units():
-    """Generate 500 condo units across floors 3-44."""
-    units = []
+    """Generate 500 condo units across floors 3-44.
+
+    Rows are Unit records. Numeric fields are ints; the sheet writer converts
+    them to text.
+    """
     unit_count = 0
+    status_counts = Counter()
 
     # Floor plan: floors 3-12 (10 floors, 16 units each = 160)
     #             floors 13-28 (16 floors, 14 units each = 224)
@@ -145,41 +178,41 @@ def generate_units():
         ]),
     ]
 
+    # Size the list up front; unit_count doubles as the next slot to fill
+    units = [None] * sum(len(floor_range) * sum(cfg[5] for cfg in configs)
+                         for floor_range, configs in floor_plans)
+
     # Floors 3-33 are delivered (31 floors)
     delivered_max_floor = 33
 
+    property_name = PROPERTY["name"]
+    randint = random.randint
+    rand = random.random
     for floor_range, configs in floor_plans:
-        for floor in floor_range:
-            unit_idx = 1
-            for utype, beds, baths, base_sqft, base_rent, count in configs:
-                for _ in range(count):
-                    sqft = base_sqft + random.randint(-30, 30)
-                    rent = base_rent + random.randint(-100, 100)
-                    unit_num = f"{floor:02d}{unit_idx:02d}"
-
-                    if floor <= delivered_max_floor:
-                        # 85% of delivered units are occupied
-                        status = "occupied" if random.random() < 0.85 else "vacant"
-                    else:
-                        status = "not_ready"
-
-                    units.append({
-                        "property_name": PROPERTY["name"],
-                        "unit_number": unit_num,
-                        "unit_type": utype,
-                        "sqft": str(sqft),
-                        "bedrooms": str(beds),
-                        "bathrooms": str(baths),
-                        "floor_number": str(floor),
-                        "market_rent": str(rent),
-                        "status": status,
-                    })
-                    unit_idx += 1
-                    unit_count += 1
+        # Expand the configs to one entry per unit slot on a floor so each
+        # unit is a single step over floor x slot (slots numbered from 1)
+        slots = [(utype, beds, baths, base_sqft, base_rent)
+                 for utype, beds, baths, base_sqft, base_rent, count in configs
+                 for _ in range(count)]
+        for floor, (unit_idx, (utype, beds, baths, base_sqft, base_rent)) in product(
+                floor_range, enumerate(slots, 1)):
+            sqft = base_sqft + randint(-30, 30)
+            rent = base_rent + randint(-100, 100)
+            unit_num = _TWO_DIGIT[floor] + _TWO_DIGIT[unit_idx]
+
+            if floor <= delivered_max_floor:
+                # 85% of delivered units are occupied
+                status = "occupied" if rand() < 0.85 else "vacant"
+            else:
+                status = "not_ready"
+
+            units[unit_count] = Unit(property_name, unit_num, utype, sqft, beds, baths,
+                                     floor, rent, status)
+            unit_count += 1
+            status_counts[status] += 1
 
     print(f"Generated {unit_count} units")
-    occupied = sum(1 for u in units if u["status"] == "occupied")
-    print(f"  Occupied: {occupied}, Vacant: {sum(1 for u in units if u['status'] == 'vacant')}, Not ready: {sum(1 for u in units if u['status'] == 'not_ready')}")
+    print(f"  Occupied: {status_counts['occupied']}, Vacant: {status_counts['vacant']}, Not ready: {status_counts['not_ready']}")
     return units
 
 
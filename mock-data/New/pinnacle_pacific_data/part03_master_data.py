@@ -18,12 +18,12 @@ def generate_projects():
             "client_name": AIRPORT["client"],
             "client_email": AIRPORT["client_email"],
             "client_phone": AIRPORT["client_phone"],
-            "budget": str(AIRPORT["budget"]),
-            "estimated_cost": str(AIRPORT["estimated_cost"]),
+            "budget": AIRPORT["budget"],
+            "estimated_cost": AIRPORT["estimated_cost"],
             "start_date": AIRPORT["start"],
             "end_date": AIRPORT["end"],
             "description": "New international terminal with 42 gates, automated people mover, customs/immigration facilities, and dual-level roadway",
-            "completion_pct": str(AIRPORT["completion"]),
+            "completion_pct": AIRPORT["completion"],
         },
         {
             "name": CONDO["name"],
@@ -37,12 +37,12 @@ def generate_projects():
             "client_name": CONDO["client"],
             "client_email": CONDO["client_email"],
             "client_phone": CONDO["client_phone"],
-            "budget": str(CONDO["budget"]),
-            "estimated_cost": str(CONDO["estimated_cost"]),
+            "budget": CONDO["budget"],
+            "estimated_cost": CONDO["estimated_cost"],
             "start_date": CONDO["start"],
             "end_date": CONDO["end"],
             "description": "44-story luxury condominium tower with 500 units, rooftop amenities, 3-level underground parking, and ground-floor retail",
-            "completion_pct": str(CONDO["completion"]),
+            "completion_pct": CONDO["completion"],
         },
     ]
 
@@ -8,11 +8,50 @@ CRITICAL RULES:
 - Opening AR/AP balances use invoices dated 2024-12-31 with gl_account=3010 (Retained Earnings).
 """
 
+from typing import NamedTuple
+
 from part01_constants import *
 
 
+class Invoice(NamedTuple):
+    invoice_number: str
+    invoice_type: str
+    invoice_date: str
+    amount: int
+    tax_amount: str
+    due_date: str
+    description: str
+    status: str
+    vendor_name: str
+    client_name: str
+    project_name: str
+    gl_account: int
+    retainage_pct: str
+    retainage_held: int
+
+
+class JournalEntryLine(NamedTuple):
+    entry_number: str
+    entry_date: str
+    description: str
+    reference: str
+    account_number: int
+    debit: str
+    credit: str
+    line_description: str
+
+
+# Monthly invoice due dates: net 30 from each month end
+_DUE_DATES = tuple((date.fromisoformat(d) + timedelta(days=30)).isoformat() for d in MONTH_ENDS)
+
+
 def generate_invoices():
-    """Generate ~120 invoices: OB invoices + 12 months receivable + 12 months payable."""
+    """Generate ~120 invoices: OB invoices + 12 months receivable + 12 months payable.
+
+    Rows are Invoice records. amount, retainage_held and gl_account are kept
+    as ints so the financial check can use them directly; they are written
+    out as text like every other cell.
+    """
     rows = []
     inv_num = 1
 
@@ -29,22 +68,22 @@ def generate_invoices():
         (5600000, CONDO["client"], CONDO["name"], "Prior year Progress Billing #23 - MEP rough-in lower floors"),
     ]
     for amt, client, proj, desc in ob_recv:
-        rows.append({
-            "invoice_number": f"INV-OB-R{inv_num:03d}",
-            "invoice_type": "receivable",
-            "invoice_date": "2024-12-31",
-            "amount": str(amt),
-            "tax_amount": "0",
-            "due_date": "2025-01-30",
-            "description": desc,
-            "status": "paid",  # Collected in Jan 2025
-            "vendor_name": "",
-            "client_name": client,
-            "project_name": proj,
-            "gl_account": "3010",
-            "retainage_pct": "0",
-            "retainage_held": "0",
-        })
+        rows.append(Invoice(
+            invoice_number=f"INV-OB-R{inv_num:03d}",
+            invoice_type="receivable",
+            invoice_date="2024-12-31",
+            amount=amt,
+            tax_amount="0",
+            due_date="2025-01-30",
+            description=desc,
+            status="paid",  # Collected in Jan 2025
+            vendor_name="",
+            client_name=client,
+            project_name=proj,
+            gl_account=3010,
+            retainage_pct="0",
+            retainage_held=0,
+        ))
         inv_num += 1
 
     # OB Payable - outstanding sub payments from prior year
@@ -56,68 +95,64 @@ def generate_invoices():
         (3400000, "Lone Star MEP Services", AIRPORT["name"], "Prior year Payment App #4 - MEP systems"),
     ]
     for amt, vendor, proj, desc in ob_pay:
-        rows.append({
-            "invoice_number": f"INV-OB-P{inv_num:03d}",
-            "invoice_type": "payable",
-            "invoice_date": "2024-12-31",
-            "amount": str(amt),
-            "tax_amount": "0",
-            "due_date": "2025-01-30",
-            "description": desc,
-            "status": "paid",  # Paid in Jan 2025
-            "vendor_name": vendor,
-            "client_name": "",
-            "project_name": proj,
-            "gl_account": "3010",
-            "retainage_pct": "0",
-            "retainage_held": "0",
-        })
+        rows.append(Invoice(
+            invoice_number=f"INV-OB-P{inv_num:03d}",
+            invoice_type="payable",
+            invoice_date="2024-12-31",
+            amount=amt,
+            tax_amount="0",
+            due_date="2025-01-30",
+            description=desc,
+            status="paid",  # Paid in Jan 2025
+            vendor_name=vendor,
+            client_name="",
+            project_name=proj,
+            gl_account=3010,
+            retainage_pct="0",
+            retainage_held=0,
+        ))
         inv_num += 1
 
     # ── Monthly Receivable Invoices (progress billings) ──
-    for mi in range(12):
-        d = MONTH_ENDS[mi]
-        mname = MONTH_NAMES[mi]
-
+    for mi, (d, due, mname, airport_amt, condo_amt) in enumerate(
+            zip(MONTH_ENDS, _DUE_DATES, MONTH_NAMES, AIRPORT_MONTHLY_REV, CONDO_MONTHLY_REV)):
         # Airport progress billing
-        amt = AIRPORT_MONTHLY_REV[mi]
-        rows.append({
-            "invoice_number": f"INV-R{inv_num:03d}",
-            "invoice_type": "receivable",
-            "invoice_date": d,
-            "amount": str(amt),
-            "tax_amount": "0",
-            "due_date": (date.fromisoformat(d) + timedelta(days=30)).isoformat(),
-            "description": f"Progress Billing #{mi+20} - {mname} 2025 - DFW Terminal 6",
-            "status": "paid" if mi < 10 else "pending",
-            "vendor_name": "",
-            "client_name": AIRPORT["client"],
-            "project_name": AIRPORT["name"],
-            "gl_account": "4000",
-            "retainage_pct": "5",
-            "retainage_held": str(round(amt * 0.05)),
-        })
+        rows.append(Invoice(
+            invoice_number=f"INV-R{inv_num:03d}",
+            invoice_type="receivable",
+            invoice_date=d,
+            amount=airport_amt,
+            tax_amount="0",
+            due_date=due,
+            description=f"Progress Billing #{mi+20} - {mname} 2025 - DFW Terminal 6",
+            status="paid" if mi < 10 else "pending",
+            vendor_name="",
+            client_name=AIRPORT["client"],
+            project_name=AIRPORT["name"],
+            gl_account=4000,
+            retainage_pct="5",
+            retainage_held=round(airport_amt * 0.05),
+        ))
         inv_num += 1
 
         # Condo progress billing
-        amt = CONDO_MONTHLY_REV[mi]
-        if amt > 0:
-            rows.append({
-                "invoice_number": f"INV-R{inv_num:03d}",
-                "invoice_type": "receivable",
-                "invoice_date": d,
-                "amount": str(amt),
-                "tax_amount": "0",
-                "due_date": (date.fromisoformat(d) + timedelta(days=30)).isoformat(),
-                "description": f"Progress Billing #{mi+24} - {mname} 2025 - Pinnacle Bay",
-                "status": "paid" if mi < 10 else "pending",
-                "vendor_name": "",
-                "client_name": CONDO["client"],
-                "project_name": CONDO["name"],
-                "gl_account": "4010",
-                "retainage_pct": "10",
-                "retainage_held": str(round(amt * 0.10)),
-            })
+        if condo_amt > 0:
+            rows.append(Invoice(
+                invoice_number=f"INV-R{inv_num:03d}",
+                invoice_type="receivable",
+                invoice_date=d,
+                amount=condo_amt,
+                tax_amount="0",
+                due_date=due,
+                description=f"Progress Billing #{mi+24} - {mname} 2025 - Pinnacle Bay",
+                status="paid" if mi < 10 else "pending",
+                vendor_name="",
+                client_name=CONDO["client"],
+                project_name=CONDO["name"],
+                gl_account=4010,
+                retainage_pct="10",
+                retainage_held=round(condo_amt * 0.10),
+            ))
             inv_num += 1
 
     # ── Monthly Payable Invoices (subcontractor payments) ──
@@ -142,43 +177,41 @@ def generate_invoices():
     # JEs handle: 5200 ($6.5M) + 5210 ($1.3M) + 5300 ($2.7M) = $10.5M
     # Invoices handle the rest through vendor AP
     INVOICE_DIRECT_TOTAL = TOTAL_DIRECT - 6500000 - 1300000 - 2700000  # $214,500,000
-    monthly_rev_totals = [AIRPORT_MONTHLY_REV[i] + CONDO_MONTHLY_REV[i] for i in range(12)]
+    monthly_rev_totals = [a + c for a, c in zip(AIRPORT_MONTHLY_REV, CONDO_MONTHLY_REV)]
     monthly_direct = allocate_to_months(INVOICE_DIRECT_TOTAL, monthly_rev_totals)
 
-    for mi in range(12):
-        d = MONTH_ENDS[mi]
-        mname = MONTH_NAMES[mi]
-        month_total = monthly_direct[mi]
-
+    sample, randint, rand = random.sample, random.randint, random.random
+    for mi, (d, due, mname, month_total) in enumerate(
+            zip(MONTH_ENDS, _DUE_DATES, MONTH_NAMES, monthly_direct)):
         # Pick 4-5 vendors per month
-        selected = random.sample(vendor_splits, random.randint(4, 5))
+        selected = sample(vendor_splits, randint(4, 5))
         total_pct = sum(s[2] for s in selected)
 
         for vendor_name, gl_acct, pct in selected:
             amt = round(month_total * pct / total_pct)
             if amt < 10000:
                 continue
-            proj = AIRPORT["name"] if gl_acct in [5010, 5020] or "DFW" in vendor_name or "Crossland" in vendor_name else CONDO["name"]
+            proj = AIRPORT["name"] if gl_acct in (5010, 5020) or "DFW" in vendor_name or "Crossland" in vendor_name else CONDO["name"]
             # Alternate project assignment to spread across both
-            if random.random() < 0.4:
+            if rand() < 0.4:
                 proj = CONDO["name"] if proj == AIRPORT["name"] else AIRPORT["name"]
 
-            rows.append({
-                "invoice_number": f"INV-P{inv_num:03d}",
-                "invoice_type": "payable",
-                "invoice_date": d,
-                "amount": str(amt),
-                "tax_amount": "0",
-                "due_date": (date.fromisoformat(d) + timedelta(days=30)).isoformat(),
-                "description": f"Payment Application - {mname} 2025 - {vendor_name}",
-                "status": "paid" if mi < 10 else "approved",
-                "vendor_name": vendor_name,
-                "client_name": "",
-                "project_name": proj,
-                "gl_account": str(gl_acct),
-                "retainage_pct": "5",
-                "retainage_held": str(round(amt * 0.05)),
-            })
+            rows.append(Invoice(
+                invoice_number=f"INV-P{inv_num:03d}",
+                invoice_type="payable",
+                invoice_date=d,
+                amount=amt,
+                tax_amount="0",
+                due_date=due,
+                description=f"Payment Application - {mname} 2025 - {vendor_name}",
+                status="paid" if mi < 10 else "approved",
+                vendor_name=vendor_name,
+                client_name="",
+                project_name=proj,
+                gl_account=gl_acct,
+                retainage_pct="5",
+                retainage_held=round(amt * 0.05),
+            ))
             inv_num += 1
 
     return rows
@@ -198,34 +231,29 @@ def generate_journal_entries():
         total_cr = sum(l[2] for l in lines)
         diff = abs(total_dr - total_cr)
         assert diff < 0.02, f"JE-{num:04d} unbalanced: DR={total_dr:.2f} CR={total_cr:.2f} diff={diff:.2f}"
+        entry_number = f"JE-{num:04d}"
         for acct, dr, cr, ldesc in lines:
-            rows.append({
-                "entry_number": f"JE-{num:04d}",
-                "entry_date": je_date,
-                "description": desc,
-                "reference": ref,
-                "account_number": str(acct),
-                "debit": fmt(dr),
-                "credit": fmt(cr),
-                "line_description": ldesc,
-            })
+            rows.append(JournalEntryLine(
+                entry_number, je_date, desc, ref, acct, fmt(dr), fmt(cr), ldesc,
+            ))
 
     # ── Opening Balance JE (non-AR/AP accounts only) ──
     ob_lines = []
+    ob_dr = ob_cr = 0  # Line totals, kept as the lines are built
     for acct, bal in sorted(OB.items()):
         if acct in (1010, 1020, 2000, 2010):
             continue  # Skip AR/AP - handled by OB invoices
         if bal > 0:
             ob_lines.append((acct, bal, 0, f"Opening balance account {acct}"))
+            ob_dr += bal
         elif bal < 0:
             ob_lines.append((acct, 0, -bal, f"Opening balance account {acct}"))
+            ob_cr += -bal
 
     # The OB invoices create: DR AR + DR Retainage Recv / CR Retained Earnings (receivables)
     # and DR Retained Earnings / CR AP + CR Retainage Payable (payables)
     # Those net out in Retained Earnings. But our OB JE excludes AR/AP/Ret accounts.
     # We need a plug to Retained Earnings to balance.
-    ob_dr = sum(l[1] for l in ob_lines)
-    ob_cr = sum(l[2] for l in ob_lines)
     plug = ob_dr - ob_cr  # If positive, we have excess debits, need more credits
     if plug > 0:
         ob_lines.append((3010, 0, plug, "Opening balance plug - AR/AP via invoices"))
@@ -240,15 +268,15 @@ def generate_journal_entries():
 
     # Allocate costs to months
     monthly_direct_costs = {}
-    for acct, (name, annual) in DIRECT_COST_ACCOUNTS.items():
+    for acct, (name, annual) in DIRECT_COST_ITEMS:
         monthly_direct_costs[acct] = allocate_to_months(annual, monthly_rev_totals)
 
     monthly_prop_mgmt = {}
-    for acct, (name, annual) in PROPERTY_MGMT_ACCOUNTS.items():
+    for acct, (name, annual) in PROP_MGMT_ITEMS:
         monthly_prop_mgmt[acct] = allocate_to_months(annual, [1]*12)  # Equal monthly
 
     monthly_overhead = {}
-    for acct, (name, annual) in OVERHEAD_ACCOUNTS.items():
+    for acct, (name, annual) in OVERHEAD_ITEMS:
         monthly_overhead[acct] = allocate_to_months(annual, [1]*12)
 
     monthly_depreciation = allocate_to_months(DEPRECIATION, [1]*12)
@@ -291,7 +319,7 @@ def generate_journal_entries():
         for acct in [6020, 6030, 6040, 6050, 6060, 6070, 6080]:
             amt = monthly_overhead[acct][mi]
             if amt > 0:
-                oh_lines.append((acct, amt, 0, OVERHEAD_ACCOUNTS[acct][0]))
+                oh_lines.append((acct, amt, 0, ACCOUNT_NAMES[acct]))
                 oh_total += amt
         oh_lines.append((1000, 0, oh_total, "Cash - overhead expenses"))
 
@@ -314,10 +342,10 @@ def generate_journal_entries():
         # 5. Property management expenses (paid from cash)
         pm_lines = []
         pm_total = 0
-        for acct in sorted(PROPERTY_MGMT_ACCOUNTS.keys()):
+        for acct, _ in PROP_MGMT_ITEMS:
             amt = monthly_prop_mgmt[acct][mi]
             if amt > 0:
-                pm_lines.append((acct, amt, 0, PROPERTY_MGMT_ACCOUNTS[acct][0]))
+                pm_lines.append((acct, amt, 0, ACCOUNT_NAMES[acct]))
                 pm_total += amt
         pm_lines.append((1000, 0, pm_total, "Cash - property management expenses"))
 
@@ -396,29 +424,29 @@ def generate_journal_entries():
 
 if __name__ == "__main__":
     invoices = generate_invoices()
-    recv = sum(1 for i in invoices if i["invoice_type"] == "receivable")
-    pay = sum(1 for i in invoices if i["invoice_type"] == "payable")
-    ob = sum(1 for i in invoices if i["invoice_number"].startswith("INV-OB"))
+    recv = sum(1 for i in invoices if i.invoice_type == "receivable")
+    pay = sum(1 for i in invoices if i.invoice_type == "payable")
+    ob = sum(1 for i in invoices if i.invoice_number.startswith("INV-OB"))
     print(f"Invoices: {len(invoices)} (OB: {ob}, Receivable: {recv-4}, Payable: {pay-5})")
-    print(f"  Total receivable amount: ${sum(float(i['amount']) for i in invoices if i['invoice_type'] == 'receivable'):,.0f}")
-    print(f"  Total payable amount: ${sum(float(i['amount']) for i in invoices if i['invoice_type'] == 'payable'):,.0f}")
+    print(f"  Total receivable amount: ${sum(i.amount for i in invoices if i.invoice_type == 'receivable'):,.0f}")
+    print(f"  Total payable amount: ${sum(i.amount for i in invoices if i.invoice_type == 'payable'):,.0f}")
 
     je_rows = generate_journal_entries()
     # Count unique JEs
-    je_nums = set(r["entry_number"] for r in je_rows)
+    je_nums = set(r.entry_number for r in je_rows)
     print(f"\nJournal entries: {len(je_nums)} entries, {len(je_rows)} lines")
 
     # Verify each JE balances
     from collections import defaultdict
-    je_totals = defaultdict(lambda: [0.0, 0.0])
+    je_debits = defaultdict(float)
+    je_credits = defaultdict(float)
     for r in je_rows:
-        dr = float(r["debit"]) if r["debit"] else 0
-        cr = float(r["credit"]) if r["credit"] else 0
-        je_totals[r["entry_number"]][0] += dr
-        je_totals[r["entry_number"]][1] += cr
+        je_debits[r.entry_number] += float(r.debit) if r.debit else 0.0
+        je_credits[r.entry_number] += float(r.credit) if r.credit else 0.0
 
     all_balanced = True
-    for je, (dr, cr) in je_totals.items():
+    for je, dr in je_debits.items():
+        cr = je_credits[je]
         if abs(dr - cr) > 0.02:
             print(f"  UNBALANCED: {je} DR={dr:.2f} CR={cr:.2f}")
             all_balanced = False
@@ -1,14 +1,49 @@
 #!/usr/bin/env python3
 """Part 8: Property management - leases, maintenance, property expenses."""
 
+from typing import NamedTuple
+
 from part01_constants import *
 from part02_foundation import generate_units
 
 
+class Lease(NamedTuple):
+    tenant_name: str
+    property_name: str
+    unit_number: str
+    tenant_email: str
+    tenant_phone: str
+    monthly_rent: int
+    security_deposit: int
+    lease_start: str
+    lease_end: str
+
+
+class MaintenanceRequest(NamedTuple):
+    title: str
+    property_name: str
+    description: str
+    priority: str
+    category: str
+    scheduled_date: str
+    estimated_cost: str
+
+
+class PropertyExpense(NamedTuple):
+    expense_type: str
+    description: str
+    amount: str
+    frequency: str
+    effective_date: str
+    end_date: str
+    vendor_name: str
+    property_name: str
+
+
 def generate_leases(units):
     """Generate leases for all occupied units."""
     rows = []
-    occupied = [u for u in units if u["status"] == "occupied"]
+    occupied = [u for u in units if u.status == "occupied"]
     used_names = set()
 
     for unit in occupied:
@@ -20,7 +55,7 @@ def generate_leases(units):
                 used_names.add(key)
                 break
 
-        rent = int(unit["market_rent"])
+        rent = unit.market_rent
         deposit = rent  # 1 month security deposit
 
         # Lease start: random between Jun 2025 and Dec 2025
@@ -38,17 +73,10 @@ def generate_leases(units):
         else:
             tenant_name = f"{first} {last}"
 
-        rows.append({
-            "tenant_name": tenant_name,
-            "property_name": PROPERTY["name"],
-            "unit_number": unit["unit_number"],
-            "tenant_email": email,
-            "tenant_phone": phone,
-            "monthly_rent": str(rent),
-            "security_deposit": str(deposit),
-            "lease_start": lease_start.isoformat(),
-            "lease_end": lease_end.isoformat(),
-        })
+        rows.append(Lease(
+            tenant_name, PROPERTY["name"], unit.unit_number, email, phone,
+            rent, deposit, lease_start.isoformat(), lease_end.isoformat(),
+        ))
 
     return rows
 
@@ -72,14 +100,10 @@ def generate_maintenance():
         ("Unit 3301 - Window Seal Failure", "Condensation between window panes indicates seal failure. IGU replacement required.", "medium", "Envelope", "2026-01-30", "950"),
         ("Trash Compactor Service", "Annual service on loading dock trash compactor. Hydraulic fluid change and ram seal inspection.", "medium", "General", "2026-02-12", "580"),
     ]
-    rows = []
-    for title, desc, pri, cat, sdate, cost in items:
-        rows.append({
-            "title": title, "property_name": PROPERTY["name"],
-            "description": desc, "priority": pri, "category": cat,
-            "scheduled_date": sdate, "estimated_cost": cost,
-        })
-    return rows
+    return [
+        MaintenanceRequest(title, PROPERTY["name"], desc, pri, cat, sdate, cost)
+        for title, desc, pri, cat, sdate, cost in items
+    ]
 
 
 def generate_property_expenses():
@@ -98,21 +122,14 @@ def generate_property_expenses():
         ("marketing", "Leasing Marketing & Advertising", "8500", "monthly", "2025-06-01", "2025-12-31", "Apartments.com / Zillow"),
         ("legal", "Tenant Legal Services Retainer", "5000", "monthly", "2025-01-01", "2025-12-31", "Winstead PC"),
     ]
-    rows = []
-    for etype, desc, amt, freq, start, end, vendor in expenses:
-        rows.append({
-            "expense_type": etype, "description": desc, "amount": amt,
-            "frequency": freq, "effective_date": start, "end_date": end,
-            "vendor_name": vendor, "property_name": PROPERTY["name"],
-        })
-    return rows
+    return [PropertyExpense(*row, PROPERTY["name"]) for row in expenses]
 
 
 if __name__ == "__main__":
     units = generate_units()
     leases = generate_leases(units)
     print(f"Leases: {len(leases)}")
-    total_rent = sum(int(l["monthly_rent"]) for l in leases)
+    total_rent = sum(l.monthly_rent for l in leases)
     print(f"  Monthly rental income: ${total_rent:,.0f}")
 
     maint = generate_maintenance()